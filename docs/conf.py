@@ -135,7 +135,6 @@ autodoc_mock_imports = [
     'pandas',
     'pytz',
     'requests',
-    'six',
     'socketIO_client_nexus',
     'sseclient',
     'temporalcache',
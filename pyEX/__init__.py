@@ -6,7 +6,15 @@
 # the Apache License 2.0.  The full license can be found in the LICENSE file.
 #
 from .client import *  # noqa: F403
-from .common import PyEXception, PyEXStopSSE, overrideSSEUrl, overrideUrl, setProxy
+from .common import (
+    PyEXception,
+    PyEXStopSSE,
+    closeAsyncSession,
+    overrideSSEUrl,
+    overrideUrl,
+    setProxy,
+    setSession,
+)
 
 try:
     from .studies import *  # noqa: F403
@@ -139,7 +147,7 @@ from .marketdata.stock import (
 from .marketdata.ws import *  # noqa: F403
 from .markets import markets, marketsDF
 from .options import optionExpirations, options, optionsDF
-from .points import points, pointsDF
+from .points import points, pointsAsync, pointsDF
 from .premium import (
     accountingQualityAndRiskMatrix,
     accountingQualityAndRiskMatrixDF,
@@ -257,7 +265,7 @@ from .premium import (
     workshops,
     workshopsDF,
 )
-from .rates import RatesPoints
+from .rates import RatesPoints, treasuries, treasuriesAsync
 from .refdata import (
     calendar,
     calendarDF,
@@ -115,7 +115,7 @@ from .marketdata.stock import (
 )
 from .markets import markets, marketsDF
 from .options import optionExpirations, options, optionsDF
-from .points import points, pointsDF
+from .points import points, pointsAsync, pointsDF
 from .premium import (
     accountingQualityAndRiskMatrix,
     accountingQualityAndRiskMatrixDF,
@@ -233,7 +233,7 @@ from .premium import (
     workshops,
     workshopsDF,
 )
-from .rates import RatesPoints
+from .rates import RatesPoints, treasuries, treasuriesAsync
 from .refdata import (
     calendar,
     calendarDF,
@@ -1084,7 +1084,11 @@ _INCLUDE_FUNCTIONS = [
     ("ceoCompensationDF", ceoCompensationDF),
     # Data Points
     ("points", points),
+    ("pointsAsync", pointsAsync),
     ("pointsDF", pointsDF),
+    # Rates
+    ("treasuries", treasuries),
+    ("treasuriesAsync", treasuriesAsync),
     # FX
     ("latestFX", latestFX),
     ("latestFXDF", latestFXDF),
@@ -5,22 +5,32 @@
 # This file is part of the pyEX library, distributed under the terms of
 # the Apache License 2.0.  The full license can be found in the LICENSE file.
 #
-from __future__ import print_function
-
+import asyncio
 import json
 import os
 import os.path
+import string
 import tempfile
+import threading
+import weakref
 from datetime import datetime
-from urllib.parse import quote, urlparse
+from functools import lru_cache
+from urllib.parse import quote
 
 import pandas as pd
 import pytz
 import requests
-from six import string_types
+from requests.adapters import HTTPAdapter
 from socketIO_client_nexus import BaseNamespace, SocketIO
 from sseclient import SSEClient
 from temporalcache import expire, interval
+from temporalcache.persistent_lru_cache import persistent_lru_cache
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
 
 _URL_PREFIX = "https://api.iextrading.com/1.0/"
 _URL_PREFIX_CLOUD = "https://cloud.iexapis.com/{version}/"
@@ -42,7 +52,7 @@ _SSE_URL_PREFIX_ALL_SANDBOX = (
 )
 _SSE_DEEP_URL_PREFIX_SANDBOX = "https://sandbox-sse.iexapis.com/{version}/deep?symbols={symbols}&channels={channels}&token={token}"
 
-_TIMEFRAME_CHART = [
+_TIMEFRAME_CHART = (
     "max",
     "5y",
     "2y",
@@ -56,30 +66,32 @@ _TIMEFRAME_CHART = [
     "5dm",
     "1d",
     "dynamic",
-]
-_TIMEFRAME_DIVSPLIT = ["5y", "2y", "1y", "ytd", "6m", "3m", "1m", "next"]
+)
+_TIMEFRAME_DIVSPLIT = ("5y", "2y", "1y", "ytd", "6m", "3m", "1m", "next")
 _LIST_OPTIONS = ["mostactive", "gainers", "losers", "iexvolume", "iexpercent"]
 _COLLECTION_TAGS = ["sector", "tag", "list"]
-_DATE_RANGES = [
-    "today",
-    "yesterday",
-    "ytd",
-    "last-week",
-    "last-month",
-    "last-quarter",
-    "d",
-    "w",
-    "m",
-    "q",
-    "y",
-    "tomorrow",
-    "this-week",
-    "this-month",
-    "this-quarter",
-    "next-week",
-    "next-month",
-    "next-quarter",
-]
+_DATE_RANGES = frozenset(
+    (
+        "today",
+        "yesterday",
+        "ytd",
+        "last-week",
+        "last-month",
+        "last-quarter",
+        "d",
+        "w",
+        "m",
+        "q",
+        "y",
+        "tomorrow",
+        "this-week",
+        "this-month",
+        "this-quarter",
+        "next-week",
+        "next-month",
+        "next-quarter",
+    )
+)
 _KEY_STATS = [
     "companyName",
     "marketcap",
@@ -114,10 +126,25 @@ _KEY_STATS = [
 ]
 _USAGE_TYPES = ["messages", "rules", "rule-records", "alerts", "alert-records"]
 _PYEX_PROXIES = None
+# characters `quote` never escapes, so symbols made of them can skip quoting
+_SAFE_SYMBOL = frozenset(string.ascii_letters + string.digits + "_.-~")
+_SAFE_SYMBOLS = _SAFE_SYMBOL | {","}
+_PYEX_POOL_CONNECTIONS = 32
+_PYEX_POOL_MAXSIZE = 64
+_PYEX_ASYNC_LIMIT = 100
+_PYEX_ASYNC_LIMIT_PER_HOST = 32
+_PYEX_ASYNC_TIMEOUT = 300
 _PYEX_CACHE_FOLDER = os.path.abspath(os.path.join(tempfile.gettempdir(), "pyEX"))
 _UTC = pytz.UTC
 _EST = pytz.timezone("EST")
 
+# pandas 2 infers the format from the first value by default and dropped
+# `infer_datetime_format`; columns that don't fit fall back in `_tryToDatetime`
+if int(pd.__version__.split(".")[0]) >= 2:
+    _DATETIME_KWARGS = {}
+else:
+    _DATETIME_KWARGS = {"infer_datetime_format": True}
+
 # Limit 10
 _BATCH_TYPES = [
     "book",
@@ -142,162 +169,168 @@ _BATCH_TYPES = [
     "volume-by-venue",
 ]
 
-_STANDARD_DATE_FIELDS = [
-    "consensusEndDate",
-    "consensusStartDate",
-    "DailyListTimestamp",
-    "date",
-    "datetime",
-    "declaredDate",
-    "EPSReportDate",
-    "endDate",
-    "exDate",
-    "expectedDate",
-    "expirationDate",
-    "fiscalEndDate",
-    "latestTime",
-    "lastTradeDate",
-    "lastUpdated",
-    "paymentDate",
-    "processedTime",
-    "recordDate",
-    "RecordUpdateTime",
-    "reportDate",
-    "settlementDate",
-    "startDate",
-]
+_STANDARD_DATE_FIELDS = frozenset(
+    (
+        "consensusEndDate",
+        "consensusStartDate",
+        "DailyListTimestamp",
+        "date",
+        "datetime",
+        "declaredDate",
+        "EPSReportDate",
+        "endDate",
+        "exDate",
+        "expectedDate",
+        "expirationDate",
+        "fiscalEndDate",
+        "latestTime",
+        "lastTradeDate",
+        "lastUpdated",
+        "paymentDate",
+        "processedTime",
+        "recordDate",
+        "RecordUpdateTime",
+        "reportDate",
+        "settlementDate",
+        "startDate",
+    )
+)
 
-_STANDARD_TIME_FIELDS = [
-    "closeTime",
-    "close.time",
-    "delayedPriceTime",
-    "extendedPriceTime",
-    "highTime",
-    "iexCloseTime",
-    "iexLastUpdated",
-    "iexOpenTime",
-    "lastTradeTime",
-    "lastUpdated",
-    "latestTime",
-    "latestUpdate",
-    "lowTime",
-    "oddLotDelayedPriceTime",
-    "openTime",
-    "open.time",
-    "processedTime",
-    "report_date",
-    "reportDate",
-    "time",
-    "timestamp",
-    "updated",
-]
+_STANDARD_TIME_FIELDS = frozenset(
+    (
+        "closeTime",
+        "close.time",
+        "delayedPriceTime",
+        "extendedPriceTime",
+        "highTime",
+        "iexCloseTime",
+        "iexLastUpdated",
+        "iexOpenTime",
+        "lastTradeTime",
+        "lastUpdated",
+        "latestTime",
+        "latestUpdate",
+        "lowTime",
+        "oddLotDelayedPriceTime",
+        "openTime",
+        "open.time",
+        "processedTime",
+        "report_date",
+        "reportDate",
+        "time",
+        "timestamp",
+        "updated",
+    )
+)
 
-_INDICATORS = [
-    "abs",
-    "acos",
-    "ad",
-    "add",
-    "adosc",
-    "adx",
-    "adxr",
-    "ao",
-    "apo",
-    "aroon",
-    "aroonosc",
-    "asin",
-    "atan",
-    "atr",
-    "avgprice",
-    "bbands",
-    "bop",
-    "cci",
-    "ceil",
-    "cmo",
-    "cos",
-    "cosh",
-    "crossany",
-    "crossover",
-    "cvi",
-    "decay",
-    "dema",
-    "di",
-    "div",
-    "dm",
-    "dpo",
-    "dx",
-    "edecay",
-    "ema",
-    "emv",
-    "exp",
-    "fisher",
-    "floor",
-    "fosc",
-    "hma",
-    "kama",
-    "kvo",
-    "lag",
-    "linreg",
-    "linregintercept",
-    "linregslope",
-    "ln",
-    "log10",
-    "macd",
-    "marketfi",
-    "mass",
-    "max",
-    "md",
-    "medprice",
-    "mfi",
-    "min",
-    "mom",
-    "msw",
-    "mul",
-    "natr",
-    "nvi",
-    "obv",
-    "ppo",
-    "psar",
-    "pvi",
-    "qstick",
-    "roc",
-    "rocr",
-    "round",
-    "rsi",
-    "sin",
-    "sinh",
-    "sma",
-    "sqrt",
-    "stddev",
-    "stderr",
-    "stoch",
-    "stochrsi",
-    "sub",
-    "sum",
-    "tan",
-    "tanh",
-    "tema",
-    "todeg",
-    "torad",
-    "tr",
-    "trima",
-    "trix",
-    "trunc",
-    "tsf",
-    "typprice",
-    "ultosc",
-    "var",
-    "vhf",
-    "vidya",
-    "volatility",
-    "vosc",
-    "vwma",
-    "wad",
-    "wcprice",
-    "wilders",
-    "willr",
-    "wma",
-    "zlema",
-]
+_INDICATORS = frozenset(
+    (
+        "abs",
+        "acos",
+        "ad",
+        "add",
+        "adosc",
+        "adx",
+        "adxr",
+        "ao",
+        "apo",
+        "aroon",
+        "aroonosc",
+        "asin",
+        "atan",
+        "atr",
+        "avgprice",
+        "bbands",
+        "bop",
+        "cci",
+        "ceil",
+        "cmo",
+        "cos",
+        "cosh",
+        "crossany",
+        "crossover",
+        "cvi",
+        "decay",
+        "dema",
+        "di",
+        "div",
+        "dm",
+        "dpo",
+        "dx",
+        "edecay",
+        "ema",
+        "emv",
+        "exp",
+        "fisher",
+        "floor",
+        "fosc",
+        "hma",
+        "kama",
+        "kvo",
+        "lag",
+        "linreg",
+        "linregintercept",
+        "linregslope",
+        "ln",
+        "log10",
+        "macd",
+        "marketfi",
+        "mass",
+        "max",
+        "md",
+        "medprice",
+        "mfi",
+        "min",
+        "mom",
+        "msw",
+        "mul",
+        "natr",
+        "nvi",
+        "obv",
+        "ppo",
+        "psar",
+        "pvi",
+        "qstick",
+        "roc",
+        "rocr",
+        "round",
+        "rsi",
+        "sin",
+        "sinh",
+        "sma",
+        "sqrt",
+        "stddev",
+        "stderr",
+        "stoch",
+        "stochrsi",
+        "sub",
+        "sum",
+        "tan",
+        "tanh",
+        "tema",
+        "todeg",
+        "torad",
+        "tr",
+        "trima",
+        "trix",
+        "trunc",
+        "tsf",
+        "typprice",
+        "ultosc",
+        "var",
+        "vhf",
+        "vidya",
+        "volatility",
+        "vosc",
+        "vwma",
+        "wad",
+        "wcprice",
+        "wilders",
+        "willr",
+        "wma",
+        "zlema",
+    )
+)
 
 _INDICATOR_RETURNS = {
     "abs": ("abs",),
@@ -415,6 +448,93 @@ class PyEXStopSSE(Exception):
     pass
 
 
+def _makeSession():
+    """internal: build a pooled requests session with retries on gateway errors"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=_PYEX_POOL_CONNECTIONS,
+        pool_maxsize=_PYEX_POOL_MAXSIZE,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False,
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _makeSession()
+
+
+def _getSession():
+    """internal: return the currently configured requests session"""
+    return _SESSION
+
+
+# aiohttp sessions are bound to the loop that created them, so keep one
+# session (and creation lock) per running loop
+_AIOHTTP_SESSIONS = weakref.WeakKeyDictionary()
+_AIOHTTP_SESSIONS_LOCK = threading.Lock()
+
+
+def _aiohttpLoopState(loop):
+    """internal: per-loop aiohttp session slot, dropping slots of closed loops"""
+    with _AIOHTTP_SESSIONS_LOCK:
+        for other in [other for other in _AIOHTTP_SESSIONS if other.is_closed()]:
+            # can no longer be closed from its own loop, just drop it
+            del _AIOHTTP_SESSIONS[other]
+
+        state = _AIOHTTP_SESSIONS.get(loop)
+        if state is None:
+            state = _AIOHTTP_SESSIONS[loop] = {"session": None, "lock": asyncio.Lock()}
+        return state
+
+
+async def _getAiohttpSession():
+    """internal: lazily build a pooled aiohttp session for the running loop"""
+    import aiohttp
+
+    state = _aiohttpLoopState(asyncio.get_running_loop())
+
+    async with state["lock"]:
+        if state["session"] is None or state["session"].closed:
+            state["session"] = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=_PYEX_ASYNC_LIMIT,
+                    limit_per_host=_PYEX_ASYNC_LIMIT_PER_HOST,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60,
+                ),
+                timeout=aiohttp.ClientTimeout(total=_PYEX_ASYNC_TIMEOUT),
+                auto_decompress=True,
+            )
+    return state["session"]
+
+
+async def closeAsyncSession():
+    """Close the running loop's aiohttp session used for async calls, if one is open
+
+    Each event loop gets its own session, so await this before that loop ends
+    (e.g. at the end of the coroutine passed to `asyncio.run`).
+    """
+    loop = asyncio.get_running_loop()
+    with _AIOHTTP_SESSIONS_LOCK:
+        state = _AIOHTTP_SESSIONS.pop(loop, None)
+
+    if state is not None and state["session"] is not None:
+        if not state["session"].closed:
+            await state["session"].close()
+
+
+@lru_cache(maxsize=16)
+def _prefix(base_url, version):
+    """internal: format a base url template for an api version"""
+    return base_url.format(version=version)
+
+
 def _get(url, token="", version="", filter="", format="json"):
     """for backwards compat, accepting token and version but ignoring"""
     token = token or os.environ.get("IEX_TOKEN")
@@ -463,7 +583,7 @@ def _getIEXCloudBase(
     base_url, url, token="", version="stable", filter="", format="json"
 ):
     """for iex cloud"""
-    url = base_url.format(version=version) + url
+    url = _prefix(base_url, version) + url
 
     params = {"token": token}
 
@@ -473,11 +593,11 @@ def _getIEXCloudBase(
     if format != "json":
         params["format"] = format
 
-    resp = requests.get(urlparse(url).geturl(), proxies=_PYEX_PROXIES, params=params)
+    resp = _SESSION.get(url, proxies=_PYEX_PROXIES, params=params)
 
     if resp.status_code == 200:
         if format == "json":
-            return resp.json()
+            return _loads(resp.content)
         return resp.text
     raise PyEXception("Response %d - " % resp.status_code, resp.text)
 
@@ -491,9 +611,7 @@ async def _getIEXCloudAsyncBase(
     base_url, url, token="", version="stable", filter="", format="json"
 ):
     """for iex cloud"""
-    import aiohttp
-
-    url = _URL_PREFIX_CLOUD.format(version=version) + url
+    url = _prefix(base_url, version) + url
     params = {"token": token}
 
     if filter:
@@ -502,16 +620,14 @@ async def _getIEXCloudAsyncBase(
     if format != "json":
         params["format"] = format
 
-    async with aiohttp.ClientSession() as session:
-        async with session.get(
-            urlparse(url).geturl(), proxy=_PYEX_PROXIES, params=params
-        ) as resp:
+    session = await _getAiohttpSession()
+    async with session.get(url, proxy=_PYEX_PROXIES, params=params) as resp:
 
-            if resp.status == 200:
-                if format == "json":
-                    return await resp.json()
-                return resp.text()
-            raise PyEXception("Response %d - " % resp.status, await resp.text())
+        if resp.status == 200:
+            if format == "json":
+                return _loads(await resp.read())
+            return await resp.text()
+        raise PyEXception("Response %d - " % resp.status, await resp.text())
 
 
 async def _getIEXCloudAsync(url, token="", version="stable", filter="", format="json"):
@@ -548,7 +664,7 @@ def _postIEXCloudBase(
     format="json",
 ):
     """for iex cloud"""
-    url = base_url.format(version=version) + url
+    url = _prefix(base_url, version) + url
 
     if token_in_params:
         params = {"token": token}
@@ -558,8 +674,8 @@ def _postIEXCloudBase(
     if format != "json":
         params["format"] = format
 
-    resp = requests.post(
-        urlparse(url).geturl(),
+    resp = _SESSION.post(
+        url,
         data=data,
         json=json,
         proxies=_PYEX_PROXIES,
@@ -567,7 +683,7 @@ def _postIEXCloudBase(
     )
     if resp.status_code == 200:
         if format == "json":
-            return resp.json()
+            return _loads(resp.content)
         return resp.text
     raise PyEXception("Response %d - " % resp.status_code, resp.text)
 
@@ -583,7 +699,7 @@ def _postIEXCloud(
 ):
     """for iex cloud"""
     return _postIEXCloudBase(
-        _URL_PREFIX_CLOUD, data, json, token, version, token_in_params, format
+        _URL_PREFIX_CLOUD, url, data, json, token, version, token_in_params, format
     )
 
 
@@ -599,9 +715,7 @@ async def _postIEXCloudAsyncBase(
     format="json",
 ):
     """for iex cloud"""
-    import aiohttp
-
-    url = base_url.format(version=version) + url
+    url = _prefix(base_url, version) + url
 
     if token_in_params:
         params = {"token": token}
@@ -611,19 +725,19 @@ async def _postIEXCloudAsyncBase(
     if format != "json":
         params["format"] = format
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
-            urlparse(url).geturl(),
-            data=data,
-            json=json,
-            proxy=_PYEX_PROXIES,
-            params=params,
-        ) as resp:
-            if resp.status == 200:
-                if format == "json":
-                    return await resp.json()
-                return resp.text()
-            raise PyEXception("Response %d - " % resp.status, await resp.text())
+    session = await _getAiohttpSession()
+    async with session.post(
+        url,
+        data=data,
+        json=json,
+        proxy=_PYEX_PROXIES,
+        params=params,
+    ) as resp:
+        if resp.status == 200:
+            if format == "json":
+                return _loads(await resp.read())
+            return await resp.text()
+        raise PyEXception("Response %d - " % resp.status, await resp.text())
 
 
 async def _postIEXCloudAsync(
@@ -674,46 +788,44 @@ def _postIEXCloudSandbox(
 
 def _deleteIEXCloudBase(base_url, url, token="", version="stable", format="json"):
     """for iex cloud"""
-    url = base_url.format(version=version) + url
+    url = _prefix(base_url, version) + url
 
     params = {"token": token}
 
     if format != "json":
         params["format"] = format
 
-    resp = requests.delete(urlparse(url).geturl(), proxies=_PYEX_PROXIES, params=params)
+    resp = _SESSION.delete(url, proxies=_PYEX_PROXIES, params=params)
 
     if resp.status_code == 200:
         if format == "json":
-            return resp.json()
+            return _loads(resp.content)
         return resp.text
     raise PyEXception("Response %d - " % resp.status_code, resp.text)
 
 
 def _deleteIEXCloud(url, token="", version="stable", format="json"):
     """for iex cloud"""
-    return _deleteIEXCloud(_URL_PREFIX_CLOUD, url, token, version, format)
+    return _deleteIEXCloudBase(_URL_PREFIX_CLOUD, url, token, version, format)
 
 
-async def _deleteIEXCloudAsyncBase(url, token="", version="stable", format="json"):
+async def _deleteIEXCloudAsyncBase(
+    base_url, url, token="", version="stable", format="json"
+):
     """for iex cloud"""
-    import aiohttp
-
-    url = _URL_PREFIX_CLOUD.format(version=version) + url
+    url = _prefix(base_url, version) + url
     params = {"token": token}
 
     if format != "json":
         params["format"] = format
 
-    async with aiohttp.ClientSession() as session:
-        async with session.delete(
-            urlparse(url).geturl(), proxy=_PYEX_PROXIES, params=params
-        ) as resp:
-            if resp.status == 200:
-                if format == "json":
-                    return await resp.json()
-                return resp.text()
-            raise PyEXception("Response %d - " % resp.status, await resp.text())
+    session = await _getAiohttpSession()
+    async with session.delete(url, proxy=_PYEX_PROXIES, params=params) as resp:
+        if resp.status == 200:
+            if format == "json":
+                return _loads(await resp.read())
+            return await resp.text()
+        raise PyEXception("Response %d - " % resp.status, await resp.text())
 
 
 async def _deleteIEXCloudAsync(url, token="", version="stable", format="json"):
@@ -735,25 +847,29 @@ def _wsURL(url):
 
 def _strToList(st):
     """internal"""
-    if isinstance(st, string_types):
+    if isinstance(st, str):
         return st.split(",")
     return st
 
 
 def _strCommaSeparatedString(st):
     """internal"""
-    return ",".join(_strToList(st))
+    if isinstance(st, str):
+        # splitting and re-joining on "," is the identity
+        return st
+    return ",".join(st)
 
 
 def _strOrDate(st):
     """internal"""
-    if isinstance(st, string_types):
+    if isinstance(st, str):
         return st
     elif isinstance(st, datetime):
         return st.strftime("%Y%m%d")
     raise PyEXception("Not a date: %s", str(st))
 
 
+@lru_cache(maxsize=64)
 def _dateRange(st):
     """internal"""
     if st not in _DATE_RANGES:
@@ -763,7 +879,7 @@ def _dateRange(st):
 
 def _raiseIfNotStr(s):
     """internal"""
-    if s is not None and not isinstance(s, string_types):
+    if s is not None and not isinstance(s, str):
         raise PyEXception("Cannot use type %s" % str(type(s)))
 
 
@@ -784,7 +900,7 @@ def _tryJson(data, raw=True):
     if raw:
         return data
     try:
-        return json.loads(data)
+        return _loads(data)
     except ValueError:
         return data
 
@@ -835,14 +951,13 @@ def _streamSSE(url, on_data=print, accrue=False):
     """internal"""
     messages = SSEClient(url)
     ret = []
+    append = ret.append
 
     for msg in messages:
-        data = msg.data
-
         try:
-            on_data(json.loads(data))
+            on_data(_loads(msg.data))
             if accrue:
-                ret.append(msg)
+                append(msg)
         except PyEXStopSSE:
             # stop listening and return
             return ret
@@ -860,7 +975,7 @@ async def _streamSSEAsync(url, accrue=False):
     async with sse_client.EventSource(url) as event_source:
         try:
             async for event in event_source:
-                yield json.loads(event.data)
+                yield _loads(event.data)
 
         except (json.JSONDecodeError, KeyboardInterrupt):
             raise
@@ -875,42 +990,46 @@ async def _streamSSEAsync(url, accrue=False):
 
 def _reindex(df, col):
     """internal"""
+    columns = set(df.columns)
     if isinstance(col, list):
-        if all([c in df.columns for c in col]):
+        if all(c in columns for c in col):
             df.set_index(col, inplace=True)
     else:
-        if col in df.columns:
+        if col in columns:
             df.set_index(col, inplace=True)
     return df
 
 
+def _tryToDatetime(series, **kwargs):
+    """internal: convert a column to datetimes, leaving it unchanged on failure"""
+    try:
+        return pd.to_datetime(series, **kwargs)
+    except Exception:
+        # skip error (e.g. mixed timezones, non-date values)
+        return series
+
+
 def _toDatetime(df, cols=None, tcols=None):
     """internal"""
-    if not isinstance(cols, list):
-        cols = [cols]
-    if not isinstance(tcols, list):
-        tcols = [tcols]
-
-    cols = cols + _STANDARD_DATE_FIELDS if cols is not None else _STANDARD_DATE_FIELDS
-    tcols = (
-        tcols + _STANDARD_TIME_FIELDS if tcols is not None else _STANDARD_TIME_FIELDS
-    )
+    date_fields = _STANDARD_DATE_FIELDS
+    if cols is not None:
+        date_fields = date_fields.union(cols if isinstance(cols, list) else [cols])
 
-    for col in cols:
-        if col in df.columns:
-            try:
-                df[col] = pd.to_datetime(df[col], infer_datetime_format=True)
-            except BaseException:
-                # skip error
-                continue
-
-    for tcol in tcols:
-        if tcol in df.columns:
-            try:
-                df[tcol] = pd.to_datetime(df[tcol], unit="ms")
-            except BaseException:
-                # skip error
-                continue
+    time_fields = _STANDARD_TIME_FIELDS
+    if tcols is not None:
+        time_fields = time_fields.union(tcols if isinstance(tcols, list) else [tcols])
+
+    columns = set(df.columns)
+    numeric = set(df.select_dtypes(include="number").columns)
+
+    # epoch millisecond fields, only meaningful on numeric columns
+    time_cols = list(time_fields & columns & numeric)
+    date_cols = list(date_fields & columns - set(time_cols))
+
+    if time_cols:
+        df[time_cols] = df[time_cols].apply(_tryToDatetime, unit="ms")
+    if date_cols:
+        df[date_cols] = df[date_cols].apply(_tryToDatetime, **_DATETIME_KWARGS)
     return df
 
 
@@ -924,14 +1043,29 @@ def setProxy(proxies=None):
     _PYEX_PROXIES = proxies
 
 
+def setSession(session=None):
+    """Set the requests session used for all http calls
+
+    Args:
+        session (requests.Session): Session to use, or None to reset to the default pooled session
+    """
+    global _SESSION
+    _SESSION = session if session is not None else _makeSession()
+
+
 def overrideUrl(url="", env=""):
     """Override the default IEX Cloud url"""
     global _URL_PREFIX_CLOUD
+    _prefix.cache_clear()
     if env:
         _URL_PREFIX_CLOUD = "https://cloud.{env}.iexapis.com/{{version}}/".format(
             env=env
         )
     elif url:
+        if not url.lower().startswith(("http://", "https://")):
+            raise PyEXception(
+                "Must provide an absolute http(s) url: got {}".format(url)
+            )
         _URL_PREFIX_CLOUD = url
     else:
         # reset
@@ -941,6 +1075,7 @@ def overrideUrl(url="", env=""):
 def overrideSSEUrl(url="", env=""):
     """Override the default IEX Cloud SSE url"""
     global _SSE_URL_PREFIX
+    _prefix.cache_clear()
     if env:
         _SSE_URL_PREFIX = "https://cloud-sse.{env}.iexapis.com/{{version}}/{{channel}}?symbols={{symbols}}&token={{token}}".format(
             env=env
@@ -952,12 +1087,22 @@ def overrideSSEUrl(url="", env=""):
         _SSE_URL_PREFIX = _SSE_URL_PREFIX_ORIG
 
 
+def _persistentCache(filename, maxsize=128):
+    """internal: in-memory lru cache, only written to disk at exit
+
+    temporalcache's default persistent cache re-pickles the whole cache on
+    every miss, so defer writing it out until the interpreter shuts down.
+    """
+    return persistent_lru_cache(filename, save_every=None, maxsize=maxsize)
+
+
 def _expire(**temporal_args):
     if not os.path.exists(_PYEX_CACHE_FOLDER):
         os.makedirs(_PYEX_CACHE_FOLDER)
 
     def _wrapper(foo):
-        temporal_args["persistent"] = os.path.join(_PYEX_CACHE_FOLDER, foo.__name__)
+        temporal_args["custom"] = _persistentCache
+        temporal_args["filename"] = os.path.join(_PYEX_CACHE_FOLDER, foo.__name__)
         return expire(**temporal_args)(foo)
 
     return _wrapper
@@ -968,7 +1113,8 @@ def _interval(**temporal_args):
         os.makedirs(_PYEX_CACHE_FOLDER)
 
     def _wrapper(foo):
-        temporal_args["persistent"] = os.path.join(_PYEX_CACHE_FOLDER, foo.__name__)
+        temporal_args["custom"] = _persistentCache
+        temporal_args["filename"] = os.path.join(_PYEX_CACHE_FOLDER, foo.__name__)
         return interval(**temporal_args)(foo)
 
     return _wrapper
@@ -984,8 +1130,13 @@ def _quoteSymbols(symbols):
     """urlquote a potentially comma-separate list of symbols"""
     if isinstance(symbols, list):
         # comma separated, quote separately
-        return ",".join(quote(symbol, safe="") for symbol in symbols)
+        return ",".join(
+            symbol if _SAFE_SYMBOL.issuperset(symbol) else quote(symbol, safe="")
+            for symbol in symbols
+        )
     # not comma separated, just quote
+    if _SAFE_SYMBOLS.issuperset(symbols):
+        return symbols
     return quote(symbols, safe=",")
 
 
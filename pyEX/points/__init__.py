@@ -5,4 +5,4 @@
 # This file is part of the pyEX library, distributed under the terms of
 # the Apache License 2.0.  The full license can be found in the LICENSE file.
 #
-from .points import points, pointsDF  # noqa: F401
+from .points import points, pointsAsync, pointsDF  # noqa: F401
@@ -9,7 +9,7 @@ from functools import wraps
 
 import pandas as pd
 
-from ..common import _get, _raiseIfNotStr, _toDatetime
+from ..common import _get, _getAsync, _raiseIfNotStr, _toDatetime
 
 
 def points(symbol="market", key="", token="", version="", filter="", format="json"):
@@ -49,6 +49,28 @@ def points(symbol="market", key="", token="", version="", filter="", format="jso
     )
 
 
+@wraps(points)
+async def pointsAsync(
+    symbol="market", key="", token="", version="", filter="", format="json"
+):
+    _raiseIfNotStr(symbol)
+    if key:
+        return await _getAsync(
+            "data-points/{symbol}/{key}".format(symbol=symbol, key=key),
+            token=token,
+            version=version,
+            filter=filter,
+            format=format,
+        )
+    return await _getAsync(
+        "data-points/{symbol}".format(symbol=symbol),
+        token=token,
+        version=version,
+        filter=filter,
+        format=format,
+    )
+
+
 @wraps(points)
 def pointsDF(symbol="market", key="", token="", version="", filter="", format="json"):
     _raiseIfNotStr(symbol)
@@ -14,6 +14,8 @@ from .rates import (
     tenYear,
     thirtyYear,
     threeMonth,
+    treasuries,
+    treasuriesAsync,
     twentyYear,
     twoYear,
 )
@@ -5,10 +5,12 @@
 # This file is part of the pyEX library, distributed under the terms of
 # the Apache License 2.0.  The full license can be found in the LICENSE file.
 #
+import asyncio
 from enum import Enum
 from functools import lru_cache
 
-from ..points import points
+from ..common import closeAsyncSession
+from ..points import points, pointsAsync
 
 
 class RatesPoints(Enum):
@@ -79,3 +81,53 @@ def threeMonth(token="", version=""):
 
 def oneMonth(token="", version=""):
     return points("DGS1MO", token=token, version=version)
+
+
+def treasuries(*keys, token="", version=""):
+    """Fetch several daily treasury rates concurrently
+
+    https://iexcloud.io/docs/api/#treasuries
+
+    Runs `treasuriesAsync` on a new event loop and closes that loop's async session
+    afterwards, leaving sessions of other loops open. It cannot be called from
+    inside a running loop (use `treasuriesAsync` there). Requires `pyEX[async]`.
+
+    Args:
+        keys (str): rates data points to fetch (see `RatesPoints`), defaults to all
+        token (str): Access token
+        version (str): API version
+
+    Returns:
+        dict: data point key to value
+    """
+
+    async def _run():
+        try:
+            return await treasuriesAsync(*keys, token=token, version=version)
+        finally:
+            await closeAsyncSession()
+
+    return asyncio.run(_run())
+
+
+async def treasuriesAsync(*keys, token="", version=""):
+    """Fetch several daily treasury rates concurrently
+
+    https://iexcloud.io/docs/api/#treasuries
+
+    Requests are gathered over the running loop's async session, await
+    `pyEX.closeAsyncSession()` before the event loop ends. Requires `pyEX[async]`.
+
+    Args:
+        keys (str): rates data points to fetch (see `RatesPoints`), defaults to all
+        token (str): Access token
+        version (str): API version
+
+    Returns:
+        dict: data point key to value
+    """
+    keys = keys or RatesPoints.options()
+    values = await asyncio.gather(
+        *[pointsAsync("market", key, token=token, version=version) for key in keys]
+    )
+    return dict(zip(keys, values))
@@ -7,8 +7,6 @@
 #
 import time
 
-import six
-
 from ..common import PyEXception
 
 _DATA_TYPES = ["boolean", "date", "dynamictime", "event", "number", "number", "string"]
@@ -150,7 +148,7 @@ class Condition(object):
                     )
                 )
         elif self.operator.type == "string":
-            if not isinstance(val, six.string_types):
+            if not isinstance(val, str):
                 raise PyEXception(
                     "RValue of type str expected for operator {}, got {}".format(
                         self.operator.toJson(), val
@@ -9,7 +9,6 @@ from functools import wraps
 from io import BytesIO
 
 import pandas as pd
-import requests
 from deprecation import deprecated
 from IPython.display import Image as ImageI
 from PIL import Image as ImageP
@@ -18,6 +17,7 @@ from ..common import (
     _UTC,
     _expire,
     _get,
+    _getSession,
     _quoteSymbols,
     _raiseIfNotStr,
     _reindex,
@@ -203,7 +203,7 @@ def logoPNG(symbol, token="", version=""):
         image: result as png
     """
     _raiseIfNotStr(symbol)
-    response = requests.get(
+    response = _getSession().get(
         logo(
             _quoteSymbols(symbol),
             token=token,
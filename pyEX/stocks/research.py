@@ -473,7 +473,7 @@ def technicals(
     _raiseIfNotStr(symbol)
     symbol = _quoteSymbols(symbol)
     if indicator not in _INDICATORS:
-        raise PyEXception("indicator must be in {}".format(_INDICATORS))
+        raise PyEXception("indicator must be in {}".format(sorted(_INDICATORS)))
 
     if range != "1d":
         if range not in _TIMEFRAME_CHART:
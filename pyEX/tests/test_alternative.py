@@ -21,33 +21,35 @@ class TestAlternative:
     def test_sentiment(self):
         from pyEX import sentiment
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
+            mock.return_value.content = b"[]"
             sentiment("test")
 
     def test_sentimentDF(self):
         from pyEX import sentimentDF
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
-            mock.return_value.json = MagicMock(return_value=[])
+            mock.return_value.content = b"[]"
             sentimentDF("test")
 
     def test_ceoComp(self):
         from pyEX import ceoCompensation
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
+            mock.return_value.content = b"[]"
             ceoCompensation("test")
 
     def test_ceoCompDF(self):
         from pyEX import ceoCompensationDF
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
-            mock.return_value.json = MagicMock(return_value=[])
+            mock.return_value.content = b"[]"
             ceoCompensationDF("test")
@@ -14,9 +14,10 @@ class TestAll:
     def test_get(self):
         from pyEX.common import PyEXception, _get
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
+            mock.return_value.content = b"[]"
             _get("")
 
             mock.return_value.status_code = 404
@@ -29,9 +30,10 @@ class TestAll:
     def test_get2(self):
         from pyEX.common import PyEXception, _get
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
+            mock.return_value.content = b"[]"
             _get("", "test", "test")
 
             mock.return_value.status_code = 404
@@ -41,6 +43,40 @@ class TestAll:
             except PyEXception:
                 pass
 
+    def test_post(self):
+        from pyEX.common import PyEXception, _post
+
+        with patch("pyEX.common._SESSION.post") as mock:
+            mock.return_value = MagicMock()
+            mock.return_value.status_code = 200
+            mock.return_value.content = b"[]"
+            _post("test", token="test", version="stable")
+            assert mock.call_args[0][0] == "https://cloud.iexapis.com/stable/test"
+
+            mock.return_value.status_code = 404
+            try:
+                _post("test", token="test", version="stable")
+                assert False
+            except PyEXception:
+                pass
+
+    def test_delete(self):
+        from pyEX.common import PyEXception, _delete
+
+        with patch("pyEX.common._SESSION.delete") as mock:
+            mock.return_value = MagicMock()
+            mock.return_value.status_code = 200
+            mock.return_value.content = b"[]"
+            _delete("test", token="test", version="stable")
+            assert mock.call_args[0][0] == "https://cloud.iexapis.com/stable/test"
+
+            mock.return_value.status_code = 404
+            try:
+                _delete("test", token="test", version="stable")
+                assert False
+            except PyEXception:
+                pass
+
     def test_tryJson(self):
         from pyEX.common import _tryJson
 
@@ -63,6 +99,26 @@ class TestAll:
 
         assert _strCommaSeparatedString(["test", "test2"]) == "test,test2"
         assert _strCommaSeparatedString("test,test2") == "test,test2"
+        assert _strCommaSeparatedString(("test", "test2")) == "test,test2"
+
+    def test_dateRange(self):
+        from pyEX.common import PyEXception, _dateRange
+
+        assert _dateRange("today") == "today"
+        assert _dateRange("today") == "today"
+        try:
+            _dateRange("test")
+            assert False
+        except PyEXception:
+            pass
+
+    def test_quoteSymbols(self):
+        from pyEX.common import _quoteSymbols
+
+        assert _quoteSymbols("AAPL,BRK.B") == "AAPL,BRK.B"
+        assert _quoteSymbols("AAPL,BRK/B") == "AAPL,BRK%2FB"
+        assert _quoteSymbols(["AAPL", "BRK.B"]) == "AAPL,BRK.B"
+        assert _quoteSymbols(["AAPL", "BRK/B", "A,B"]) == "AAPL,BRK%2FB,A%2CB"
 
     def test_setProxy(self):
         import pyEX.common as pc
@@ -72,6 +128,103 @@ class TestAll:
         assert pc._PYEX_PROXIES == "test"
         pc.setProxy(None)
 
+    def test_setSession(self):
+        import requests
+
+        import pyEX.common as pc
+
+        session = requests.Session()
+        pc.setSession(session)
+        assert pc._SESSION is session
+        pc.setSession(None)
+        assert pc._SESSION is not session
+        assert isinstance(pc._SESSION, requests.Session)
+
+    def test_overrideUrl(self):
+        import pyEX.common as pc
+
+        pc.overrideUrl(url="https://test.iexapis.com/{version}/")
+        assert pc._URL_PREFIX_CLOUD == "https://test.iexapis.com/{version}/"
+        try:
+            pc.overrideUrl(url="test.iexapis.com/{version}/")
+            assert False
+        except pc.PyEXception:
+            pass
+        pc.overrideUrl()
+        assert pc._URL_PREFIX_CLOUD == pc._URL_PREFIX_CLOUD_ORIG
+
+    def test_asyncSession(self):
+        import asyncio
+
+        import pyEX.common as pc
+
+        async def _run():
+            session = await pc._getAiohttpSession()
+            assert session is await pc._getAiohttpSession()
+            await pc.closeAsyncSession()
+            assert session.closed
+            assert asyncio.get_running_loop() not in pc._AIOHTTP_SESSIONS
+
+        asyncio.run(_run())
+
+    def test_asyncSessionPerLoop(self):
+        import asyncio
+
+        import pyEX.common as pc
+
+        other = asyncio.new_event_loop()
+        try:
+            first = other.run_until_complete(pc._getAiohttpSession())
+
+            async def _run():
+                session = await pc._getAiohttpSession()
+                assert session is not first
+                await pc.closeAsyncSession()
+                return session
+
+            second = asyncio.run(_run())
+            assert second.closed
+            assert not first.closed
+            assert other.run_until_complete(pc._getAiohttpSession()) is first
+            other.run_until_complete(pc.closeAsyncSession())
+            assert first.closed
+        finally:
+            other.close()
+
+    def test_asyncSessionThreads(self):
+        import asyncio
+        import threading
+
+        import pyEX.common as pc
+
+        barrier = threading.Barrier(2, timeout=10)
+        results = {}
+
+        async def _run(i):
+            loop = asyncio.get_running_loop()
+            session = await pc._getAiohttpSession()
+            # both loops hold a session at the same time
+            await loop.run_in_executor(None, barrier.wait)
+            if i == 0:
+                await pc.closeAsyncSession()
+            await loop.run_in_executor(None, barrier.wait)
+            if i == 1:
+                results[i] = (await pc._getAiohttpSession()) is session
+                results["open"] = not session.closed
+                await pc.closeAsyncSession()
+            else:
+                results[i] = session.closed
+
+        threads = [
+            threading.Thread(target=asyncio.run, args=(_run(i),)) for i in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        assert results == {0: True, 1: True, "open": True}
+
     def test_strOrDate(self):
         from datetime import datetime
 
@@ -95,6 +248,68 @@ class TestAll:
         except PyEXception:
             pass
 
+    def test_reindex(self):
+        import pandas as pd
+
+        from pyEX.common import _reindex
+
+        df = _reindex(pd.DataFrame({"date": [1], "symbol": ["a"]}), "date")
+        assert df.index.name == "date"
+        df = _reindex(pd.DataFrame({"date": [1], "symbol": ["a"]}), ["date", "test"])
+        assert "date" in df.columns
+        df = _reindex(pd.DataFrame({"date": [1], "symbol": ["a"]}), ["date", "symbol"])
+        assert list(df.index.names) == ["date", "symbol"]
+
+    def test_toDatetime(self):
+        import pandas as pd
+
+        from pyEX.common import _toDatetime
+
+        df = pd.DataFrame(
+            {
+                "date": ["2020-01-01"],
+                "updated": [1577836800000],
+                "custom": ["2020-01-02"],
+                "other": ["test"],
+            }
+        )
+        df = _toDatetime(df, cols="custom")
+        assert pd.api.types.is_datetime64_any_dtype(df["date"])
+        assert pd.api.types.is_datetime64_any_dtype(df["updated"])
+        assert pd.api.types.is_datetime64_any_dtype(df["custom"])
+        assert df["other"][0] == "test"
+
+        df = pd.DataFrame(
+            {
+                "date": ["2020-01-01T00:00:00Z", "2020-01-01"],
+                "endDate": ["n/a", "n/a"],
+                "startDate": [{"test": 1}, {"test": 2}],
+                "exDate": ["2020-01-01", "2020-01-02"],
+            }
+        )
+        df = _toDatetime(df)
+        assert list(df["date"]) == ["2020-01-01T00:00:00Z", "2020-01-01"]
+        assert list(df["endDate"]) == ["n/a", "n/a"]
+        assert list(df["startDate"]) == [{"test": 1}, {"test": 2}]
+        assert pd.api.types.is_datetime64_any_dtype(df["exDate"])
+
+    def test_expire(self):
+        from pyEX.common import _expire, _interval
+
+        for decorator in (_expire(hour=0), _interval(minutes=5)):
+            calls = MagicMock(return_value=1)
+
+            def _pyex_test_cached(x):
+                return calls(x)
+
+            cached = decorator(_pyex_test_cached)
+            cached.cache_clear()
+            with patch("pickle.dump") as dump:
+                assert cached(1) == 1
+                assert cached(1) == 1
+                assert calls.call_count == 1
+                dump.assert_not_called()
+
     def test_wsclient(self):
         from pyEX.common import WSClient
 
@@ -113,6 +328,23 @@ class TestAll:
             ws.sendinit = "test"
             ws.run()
 
+    def test_streamSSE(self):
+        from pyEX.common import PyEXStopSSE, _streamSSE
+
+        received = []
+
+        def on_data(data):
+            received.append(data)
+            if len(received) == 2:
+                raise PyEXStopSSE()
+
+        messages = [MagicMock(data='{"test": %d}' % i) for i in range(3)]
+        with patch("pyEX.common.SSEClient", return_value=messages):
+            ret = _streamSSE("", on_data=on_data, accrue=True)
+
+        assert received == [{"test": 0}, {"test": 1}]
+        assert ret == messages[:1]
+
     def test_stream(self):
         from pyEX.common import _stream
 
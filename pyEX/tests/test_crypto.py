@@ -21,10 +21,10 @@ class TestAll:
     def test_bookcrypto(self):
         from pyEX import Client
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
-            mock.return_value.json = MagicMock(return_value=[])
+            mock.return_value.content = b"[]"
 
             c = Client(version="sandbox")
             c.cryptoBookDF(SYMBOL)
@@ -32,10 +32,10 @@ class TestAll:
     def test_pricecrypto(self):
         from pyEX import Client
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
-            mock.return_value.json = MagicMock(return_value=[])
+            mock.return_value.content = b"[]"
 
             c = Client(version="sandbox")
             c.cryptoPriceDF(SYMBOL)
@@ -43,10 +43,10 @@ class TestAll:
     def test_quotecrypto(self):
         from pyEX import Client
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
-            mock.return_value.json = MagicMock(return_value=[])
+            mock.return_value.content = b"[]"
 
             c = Client(version="sandbox")
             c.cryptoQuoteDF(SYMBOL)
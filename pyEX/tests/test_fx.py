@@ -21,10 +21,10 @@ class TestAll:
     def test_latestfx(self):
         from pyEX import Client
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
-            mock.return_value.json = MagicMock(return_value=[])
+            mock.return_value.content = b"[]"
 
             c = Client(version="sandbox")
             c.latestFXDF()
@@ -33,10 +33,10 @@ class TestAll:
     def test_convertfx(self):
         from pyEX import Client
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
-            mock.return_value.json = MagicMock(return_value=[])
+            mock.return_value.content = b"[]"
 
             c = Client(version="sandbox")
             c.convertFXDF()
@@ -46,10 +46,10 @@ class TestAll:
     def test_historicalfx(self):
         from pyEX import Client
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
-            mock.return_value.json = MagicMock(return_value=[])
+            mock.return_value.content = b"[]"
 
             c = Client(version="sandbox")
             c.historicalFXDF()
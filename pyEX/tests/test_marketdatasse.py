@@ -27,7 +27,8 @@ class TestAll:
     def test_tops(self):
         from pyEX import Client
 
-        with patch("requests.get") as mock:
+        with patch("pyEX.common._SESSION.get") as mock:
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
+            mock.return_value.content = b"[]"
             c = Client(version="sandbox")
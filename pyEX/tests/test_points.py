@@ -21,9 +21,10 @@ class TestPoints:
     def test_points(self):
         from pyEX import points
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
+            mock.return_value.content = b"[]"
             points()
             points("aapl")
             points("aapl", "test")
@@ -31,8 +32,8 @@ class TestPoints:
     def test_pointsDF(self):
         from pyEX import pointsDF
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
-            mock.return_value.json = MagicMock(return_value=[])
+            mock.return_value.content = b"[]"
             pointsDF("test")
@@ -7,7 +7,7 @@
 #
 
 # for Coverage
-from mock import patch
+from mock import AsyncMock, patch
 
 
 class TestRates:
@@ -25,3 +25,58 @@ class TestRates:
             c.sixMonth()
             c.threeMonth()
             c.oneMonth()
+
+    def test_treasuries(self):
+        from pyEX import Client
+
+        c = Client("test")
+        with patch("pyEX.common._getIEXCloudAsync", new_callable=AsyncMock) as mock:
+            mock.return_value = 1.5
+            assert c.treasuries("DGS30", "DGS10") == {"DGS30": 1.5, "DGS10": 1.5}
+            assert mock.call_count == 2
+            assert len(c.treasuries()) == 9
+
+    def test_treasuriesClosesSession(self):
+        import asyncio
+
+        import pyEX.common as pc
+        from pyEX import treasuries
+
+        sessions = []
+        loops = []
+
+        async def _get(*args, **kwargs):
+            sessions.append(await pc._getAiohttpSession())
+            loops.append(asyncio.get_running_loop())
+            return 1.5
+
+        with patch("pyEX.common._getIEXCloudAsync", side_effect=_get):
+            treasuries("DGS30", token="test")
+            treasuries("DGS10", token="test")
+
+        assert not any(loop in pc._AIOHTTP_SESSIONS for loop in loops)
+        assert len(sessions) == 2
+        assert all(session.closed for session in sessions)
+
+    def test_treasuriesKeepsOtherSessions(self):
+        import asyncio
+
+        import pyEX.common as pc
+        from pyEX import treasuries
+
+        other = asyncio.new_event_loop()
+        try:
+            session = other.run_until_complete(pc._getAiohttpSession())
+
+            async def _get(*args, **kwargs):
+                assert await pc._getAiohttpSession() is not session
+                return 1.5
+
+            with patch("pyEX.common._getIEXCloudAsync", side_effect=_get):
+                assert treasuries("DGS30", token="test") == {"DGS30": 1.5}
+
+            assert not session.closed
+            assert other in pc._AIOHTTP_SESSIONS
+            other.run_until_complete(pc.closeAsyncSession())
+        finally:
+            other.close()
@@ -7,6 +7,7 @@
 #
 
 # for Coverage
+import json
 from mock import MagicMock, patch
 
 
@@ -39,9 +40,10 @@ class TestAll:
             symbols,
         )
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
+            mock.return_value.content = b"[]"
             symbols()
             iexSymbols()
             mutualFundSymbols()
@@ -49,19 +51,19 @@ class TestAll:
             internationalSymbols()
             internationalSymbols("GB")
             internationalSymbols(exchange="test")
-            mock.return_value.json = MagicMock(
-                return_value={"currencies": [], "pairs": []}
-            )
+            mock.return_value.content = json.dumps(
+                {"currencies": [], "pairs": []}
+            ).encode()
             fxSymbols()
 
     def test_symbolsDF(self):
         from pyEX import Client
         from pyEX.refdata import symbolsDF
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
-            mock.return_value.json = MagicMock(return_value=[])
+            mock.return_value.content = b"[]"
             c = Client(version="sandbox")
             symbolsDF()
             c.iexSymbolsDF()
@@ -79,19 +81,19 @@ class TestAll:
             c.internationalSymbolsList("GB")
             c.internationalSymbolsList(exchange="test")
 
-            mock.return_value.json = MagicMock(
-                return_value={"currencies": [], "pairs": []}
-            )
+            mock.return_value.content = json.dumps(
+                {"currencies": [], "pairs": []}
+            ).encode()
             c.fxSymbolsDF()
             c.fxSymbolsList()
 
     def test_calendar(self):
         from pyEX import Client
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
-            mock.return_value.json = MagicMock(return_value=[])
+            mock.return_value.content = b"[]"
             c = Client(version="sandbox")
             c.calendar()
             c.holidays()
@@ -99,10 +101,10 @@ class TestAll:
     def test_calendarDF(self):
         from pyEX import Client
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
-            mock.return_value.json = MagicMock(return_value=[])
+            mock.return_value.content = b"[]"
             c = Client(version="sandbox")
             c.calendarDF()
             c.holidaysDF()
@@ -110,141 +112,149 @@ class TestAll:
     def test_corporateActions(self):
         from pyEX.refdata import corporateActions
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
+            mock.return_value.content = b"[]"
             corporateActions()
             corporateActions("20170202")
 
     def test_corporateActionsDF(self):
         from pyEX.refdata import corporateActionsDF
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
-            mock.return_value.json = MagicMock(return_value=[])
+            mock.return_value.content = b"[]"
             corporateActionsDF()
 
     def test_dividends(self):
         from pyEX.refdata import refDividends
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
+            mock.return_value.content = b"[]"
             refDividends()
             refDividends("20170202")
 
     def test_dividendsDF(self):
         from pyEX.refdata import refDividendsDF
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
-            mock.return_value.json = MagicMock(return_value=[])
+            mock.return_value.content = b"[]"
             refDividendsDF()
 
     def test_nextDayExtDate(self):
         from pyEX.refdata import nextDayExtDate
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
+            mock.return_value.content = b"[]"
             nextDayExtDate()
             nextDayExtDate("20170202")
 
     def test_nextDayExtDateDF(self):
         from pyEX.refdata import nextDayExtDateDF
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
-            mock.return_value.json = MagicMock(return_value=[])
+            mock.return_value.content = b"[]"
             nextDayExtDateDF()
 
     def test_directory(self):
         from pyEX.refdata import directory
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
+            mock.return_value.content = b"[]"
             directory()
             directory("20170202")
 
     def test_directoryDF(self):
         from pyEX.refdata import directoryDF
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
-            mock.return_value.json = MagicMock(return_value=[])
+            mock.return_value.content = b"[]"
             directoryDF()
 
     def test_sectors(self):
         from pyEX.refdata import sectors
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
+            mock.return_value.content = b"[]"
             sectors()
 
     def test_sectorsDF(self):
         from pyEX.refdata import sectorsDF
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
-            mock.return_value.json = MagicMock(return_value=[])
+            mock.return_value.content = b"[]"
             sectorsDF()
 
     def test_exchanges(self):
         from pyEX.refdata import exchanges, internationalExchanges
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
+            mock.return_value.content = b"[]"
             exchanges()
             internationalExchanges()
 
     def test_exchangesDF(self):
         from pyEX.refdata import exchangesDF, internationalExchangesDF
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
-            mock.return_value.json = MagicMock(return_value=[])
+            mock.return_value.content = b"[]"
             exchangesDF()
             internationalExchangesDF()
 
     def test_figi(self):
         from pyEX.refdata import figi
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
+            mock.return_value.content = b"[]"
             figi("")
 
     def test_figiDF(self):
         from pyEX.refdata import figiDF
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
-            mock.return_value.json = MagicMock(return_value=[])
+            mock.return_value.content = b"[]"
             figiDF("")
 
     def test_tags(self):
         from pyEX.refdata import tags
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
+            mock.return_value.content = b"[]"
             tags()
 
     def test_tagsDF(self):
         from pyEX.refdata import tagsDF
 
-        with patch("requests.get") as mock, patch("pickle.dump"):
+        with patch("pyEX.common._SESSION.get") as mock, patch("pickle.dump"):
             mock.return_value = MagicMock()
             mock.return_value.status_code = 200
-            mock.return_value.json = MagicMock(return_value=[])
+            mock.return_value.content = b"[]"
             tagsDF()
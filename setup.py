@@ -38,10 +38,9 @@ requires = [
     "pandas>=0.22",
     "pytz>=2019.1",
     "requests>=2.21.0",
-    "six",
     "socketIO-client-nexus>=0.7.6",
     "sseclient>=0.0.22",
-    "temporal-cache>=0.1.1",
+    "temporal-cache>=0.1.6",
 ]
 
 requires_async = requires + [
@@ -49,10 +48,15 @@ requires_async = requires + [
     "aiohttp-sse-client>=0.2.0",
 ]
 
+requires_fast = [
+    "orjson>=3.0.0",
+]
+
 requires_studies = [] if os.environ.get("READTHEDOCS") else ["TA-Lib>=0.4.17"]
 
 requires_dev = (
     requires_async
+    + requires_fast
     + requires_studies
     + [
         "black>=20.",
@@ -91,6 +95,7 @@ setup(
     extras_require={
         "dev": requires_dev,
         "async": requires_async,
+        "fast": requires_fast,
         "studies": requires_studies,
     },
 )